@@ -4,11 +4,13 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import timedelta
+from typing import TypedDict
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -28,8 +30,67 @@ MAX_BACKOFF_THRESHOLD = 12     # Switch to 5 min after 12 failures
 # memory-pressured devices (e.g. Echo Show 5) whose API thread stalls under GC.
 HTTP_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
 
-
-class DashieCoordinator(DataUpdateCoordinator):
+# Polls confirming entity commands run this many seconds after the first
+# request, so a script or scene toggling several entities triggers one fetch
+COMMAND_REFRESH_DELAY = 1.0
+
+
+class RtspStatus(TypedDict, total=False):
+    """Stream server state from the getRtspStatus API."""
+
+    isStreaming: bool
+    streamUrl: str
+    clientCount: int
+
+
+class RtspConfig(TypedDict, total=False):
+    """Stream settings from deviceInfo's rtspConfig or the getRtspConfig API."""
+
+    width: int
+    height: int
+    fps: int
+    softwareEncoding: bool
+
+
+class DashieData(TypedDict, total=False):
+    """Coordinator data: the deviceInfo payload plus keys added on refresh.
+
+    Only keys the integration reads are listed; the device reports more.
+    rtsp_config/rtsp_status are always dicts when present and the camera_*
+    and rtspSoftwareEncoding keys are always set (see _normalize_data).
+    """
+
+    deviceID: str
+    stableDeviceID: str
+    deviceName: str
+    deviceModel: str
+    deviceManufacturer: str
+    appVersionName: str
+    isScreenOn: bool
+    isInScreensaver: bool
+    kioskLocked: bool
+    hasPinSet: bool
+    isDarkMode: bool
+    supportsDarkMode: bool
+    autoBrightness: bool
+    canControlBrightness: bool
+    isDeviceAdmin: bool
+    keepScreenOn: bool
+    hideSidebar: bool
+    hideHeader: bool
+    startOnBoot: bool
+    videoFeedTriggerEntities: list[str]
+    rtspEnabled: bool
+    rtspSoftwareEncoding: bool
+    rtspConfig: RtspConfig
+    rtsp_config: RtspConfig
+    rtsp_status: RtspStatus
+    camera_fps: int | None
+    camera_resolution: str | None
+    camera_stream_url: str | None
+
+
+class DashieCoordinator(DataUpdateCoordinator[DashieData]):
     """Coordinator to manage fetching data from Dashie device."""
 
     def __init__(
@@ -47,6 +108,9 @@ class DashieCoordinator(DataUpdateCoordinator):
             name=f"Dashie {host}",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
             config_entry=config_entry,
+            # Polls return a fresh dict; skip listener callbacks when it
+            # compares equal to the previous one (nothing changed on device)
+            always_update=False,
         )
         self.host = host
         _LOGGER.debug("Coordinator created for %s (id=%s)", host, id(self))
@@ -64,6 +128,16 @@ class DashieCoordinator(DataUpdateCoordinator):
         self._trigger_unsub: list = []
         # Device identity (set by __init__.py from config entry)
         self.device_id: str | None = None
+        # Kept apart from the request_refresh debouncer, which
+        # async_set_updated_data() cancels: the optimistic update that follows
+        # a command must not drop the poll confirming it
+        self._command_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=COMMAND_REFRESH_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+        )
 
     @property
     def stored_pin(self) -> str:
@@ -83,12 +157,20 @@ class DashieCoordinator(DataUpdateCoordinator):
 
     async def async_shutdown(self) -> None:
         """Close the HTTP session on shutdown."""
+        self._command_refresh.async_cancel()
         self._unsubscribe_triggers()
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
         await super().async_shutdown()
 
+    async def async_request_command_refresh(self) -> None:
+        """Poll the device shortly after a command to confirm its effects.
+
+        Only starts a timer; requests made before it fires share one poll.
+        """
+        await self._command_refresh.async_call()
+
     def update_local_data(self, **kwargs) -> None:
         """Optimistically update local data cache for immediate UI feedback.
 
@@ -143,7 +225,7 @@ class DashieCoordinator(DataUpdateCoordinator):
         self._consecutive_failures = 0
         self.update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> DashieData:
         """Fetch data from Dashie device."""
         try:
             async with asyncio.timeout(10):
@@ -164,7 +246,7 @@ class DashieCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Unexpected error with device at %s: %s", self.host, err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    async def _fetch_device_info(self) -> dict:
+    async def _fetch_device_info(self) -> DashieData:
         """Fetch device info from the device API."""
         session = await self._get_session()
 
@@ -192,7 +274,7 @@ class DashieCoordinator(DataUpdateCoordinator):
             # Carry over rtspConfig from deviceInfo if present
             if "rtspConfig" in data:
                 data["rtsp_config"] = data["rtspConfig"]
-            return data
+            return self._normalize_data(data)
 
         # Fetch RTSP status and config in parallel
         rtsp_status_task = self._fetch_rtsp_status(session)
@@ -221,9 +303,35 @@ class DashieCoordinator(DataUpdateCoordinator):
             if isinstance(rtsp_config, dict):
                 data["rtsp_config"] = rtsp_config
 
+        return self._normalize_data(data)
+
+    @staticmethod
+    def _normalize_data(data: DashieData) -> DashieData:
+        """Enforce the shape entities rely on, once per refresh.
+
+        Nested RTSP payloads are either dicts or absent, so entities can
+        chain .get() calls without re-checking types on every update. Values
+        the camera sensors need are flattened to top-level camera_* keys, and
+        rtspSoftwareEncoding is always present at the top level.
+        """
+        for key in ("rtsp_config", "rtsp_status"):
+            if key in data and not isinstance(data[key], dict):
+                del data[key]
+
+        rtsp_config = data.get("rtsp_config", {})
+        width = rtsp_config.get("width")
+        height = rtsp_config.get("height")
+        data["camera_fps"] = rtsp_config.get("fps")
+        data["camera_resolution"] = f"{width}x{height}" if width and height else None
+        data["camera_stream_url"] = data.get("rtsp_status", {}).get("streamUrl")
+        # Older app versions only report the encoder inside rtsp_config
+        if "rtspSoftwareEncoding" not in data:
+            data["rtspSoftwareEncoding"] = rtsp_config.get("softwareEncoding", False)
         return data
 
-    async def _fetch_rtsp_status(self, session: aiohttp.ClientSession) -> dict | None:
+    async def _fetch_rtsp_status(
+        self, session: aiohttp.ClientSession
+    ) -> RtspStatus | None:
         """Fetch RTSP stream status from the device."""
         try:
             url = f"{self.base_url}/?cmd=getRtspStatus"
@@ -239,7 +347,9 @@ class DashieCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Could not fetch RTSP status: %s", err)
         return None
 
-    async def _fetch_rtsp_config(self, session: aiohttp.ClientSession) -> dict | None:
+    async def _fetch_rtsp_config(
+        self, session: aiohttp.ClientSession
+    ) -> RtspConfig | None:
         """Fetch RTSP configuration from the device."""
         try:
             url = f"{self.base_url}/?cmd=getRtspConfig"
@@ -299,7 +409,7 @@ class DashieCoordinator(DataUpdateCoordinator):
 
     # Keep legacy method for backward compat during transition
     @callback
-    def _update_trigger_subscriptions(self, data: dict) -> None:
+    def _update_trigger_subscriptions(self, data: DashieData) -> None:
         """Legacy: update from deviceInfo. No-op if feed registry is active."""
         if self._feed_registry:
             return  # Triggers managed by registry now
@@ -457,3 +567,13 @@ class DashieCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to send command %s: %s", command, err)
             return False
+
+    async def send_commands(self, *commands: str) -> bool:
+        """Send several parameterless commands to the device concurrently.
+
+        Returns True only if every command succeeded.
+        """
+        results = await asyncio.gather(
+            *(self.send_command(command) for command in commands)
+        )
+        return all(results)
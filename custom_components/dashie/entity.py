@@ -1,22 +1,50 @@
 """Base entity for Dashie integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import DashieCoordinator
 
+# Shared read-only attributes for entities without coordinator data
+EMPTY_ATTRS: Mapping[str, Any] = MappingProxyType({})
+
 
 class DashieEntity(CoordinatorEntity[DashieCoordinator]):
     """Base class for Dashie entities."""
 
     _attr_has_entity_name = True
+    # Suffix appended to the device ID to form the unique ID. Subclasses that
+    # set this don't need their own __init__.
+    _unique_suffix: str | None = None
 
     def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self._device_id = device_id
+        if self._unique_suffix is not None:
+            self._attr_unique_id = f"{device_id}_{self._unique_suffix}"
+        self._update_attrs()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update cached _attr_* values from coordinator data.
+
+        Runs once at construction and again on every coordinator update, so
+        state reads between polls are plain attribute lookups.
+        """
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -14,7 +14,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, CONF_DEVICE_ID
 from .coordinator import DashieCoordinator
-from .entity import DashieEntity
+from .entity import EMPTY_ATTRS, DashieEntity
+
+# 2**-30 is exact in binary floating point, so multiplying by it gives the same
+# result as dividing by 1024**3
+GB_PER_BYTE = 1 / 1024 ** 3
 
 
 async def async_setup_entry(
@@ -63,26 +67,17 @@ class DashieBatterySensor(DashieEntity, SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_translation_key = "battery"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Battery"
+    _unique_suffix = "battery"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_battery"
-        self._attr_name = "Battery"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the battery level."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("batteryLevel")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional battery attributes."""
+    def _update_attrs(self) -> None:
+        """Update the battery level and attributes from coordinator data."""
         if not self.coordinator.data:
-            return {}
-        return {
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        self._attr_native_value = self.coordinator.data.get("batteryLevel")
+        self._attr_extra_state_attributes = {
             "plugged": self.coordinator.data.get("plugged"),
         }
 
@@ -96,19 +91,13 @@ class DashieLightSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:brightness-5"
     _attr_translation_key = "light"
     # No EntityCategory = shown in Sensors section (not Status)
+    _attr_name = "Ambient Light"
+    _unique_suffix = "light"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_light"
-        self._attr_name = "Ambient Light"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the ambient light level in lux."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("ambientLight")
-        return None
+    def _update_attrs(self) -> None:
+        """Update the ambient light level in lux from coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get("ambientLight") if data else None
 
 
 class DashieCurrentPageSensor(DashieEntity, SensorEntity):
@@ -117,19 +106,13 @@ class DashieCurrentPageSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:web"
     _attr_translation_key = "current_page"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Current Page"
+    _unique_suffix = "current_page"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_current_page"
-        self._attr_name = "Current Page"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the current page URL."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("currentPage")
-        return None
+    def _update_attrs(self) -> None:
+        """Update the current page URL from coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get("currentPage") if data else None
 
 
 class DashieWifiSignalSensor(DashieEntity, SensorEntity):
@@ -140,26 +123,17 @@ class DashieWifiSignalSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:wifi"
     _attr_translation_key = "wifi_signal"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "WiFi Signal"
+    _unique_suffix = "wifi_signal"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_wifi_signal"
-        self._attr_name = "WiFi Signal"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the WiFi signal strength as percentage."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("wifiSignalLevel")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional WiFi attributes."""
+    def _update_attrs(self) -> None:
+        """Update the WiFi signal percentage and attributes from coordinator data."""
         if not self.coordinator.data:
-            return {}
-        return {
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        self._attr_native_value = self.coordinator.data.get("wifiSignalLevel")
+        self._attr_extra_state_attributes = {
             "ssid": self.coordinator.data.get("ssid"),
             "ip_address": self.coordinator.data.get("ip4"),
             "mac_address": self.coordinator.data.get("Mac"),
@@ -175,30 +149,22 @@ class DashieStorageSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:harddisk"
     _attr_translation_key = "storage"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Storage Free"
+    _unique_suffix = "storage"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_storage"
-        self._attr_name = "Storage Free"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the free storage in GB."""
-        if self.coordinator.data:
-            free_bytes = self.coordinator.data.get("internalStorageFreeSpace")
-            if free_bytes is not None:
-                return round(free_bytes / (1024 ** 3), 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional storage attributes."""
+    def _update_attrs(self) -> None:
+        """Update the free storage in GB and attributes from coordinator data."""
         if not self.coordinator.data:
-            return {}
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        free_bytes = self.coordinator.data.get("internalStorageFreeSpace")
         total_bytes = self.coordinator.data.get("internalStorageTotalSpace")
-        return {
-            "total_gb": round(total_bytes / (1024 ** 3), 2) if total_bytes else None,
+        self._attr_native_value = (
+            round(free_bytes * GB_PER_BYTE, 2) if free_bytes is not None else None
+        )
+        self._attr_extra_state_attributes = {
+            "total_gb": round(total_bytes * GB_PER_BYTE, 2) if total_bytes else None,
         }
 
 
@@ -208,19 +174,13 @@ class DashieDeviceIdSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:identifier"
     _attr_translation_key = "device_id"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Device ID"
+    _unique_suffix = "device_id"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_device_id"
-        self._attr_name = "Device ID"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the device ID."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("deviceID")
-        return None
+    def _update_attrs(self) -> None:
+        """Update the device ID from coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get("deviceID") if data else None
 
 
 class DashieRamUsageSensor(DashieEntity, SensorEntity):
@@ -235,25 +195,16 @@ class DashieRamUsageSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:memory"
     _attr_translation_key = "ram_usage"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "RAM Usage"
+    _unique_suffix = "ram_usage"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_ram_usage"
-        self._attr_name = "RAM Usage"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the system RAM usage percentage."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("ramUsedPercent")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional RAM attributes."""
+    def _update_attrs(self) -> None:
+        """Update the system RAM usage percentage and attributes from coordinator data."""
         if not self.coordinator.data:
-            return {}
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        self._attr_native_value = self.coordinator.data.get("ramUsedPercent")
         attrs = {}
         total_mb = self.coordinator.data.get("ramTotalMb")
         available_mb = self.coordinator.data.get("ramAvailableMb")
@@ -264,7 +215,7 @@ class DashieRamUsageSensor(DashieEntity, SensorEntity):
             attrs["available_mb"] = available_mb
         if app_memory_mb:
             attrs["app_pss_mb"] = app_memory_mb
-        return attrs
+        self._attr_extra_state_attributes = attrs
 
 
 class DashieAndroidVersionSensor(DashieEntity, SensorEntity):
@@ -273,26 +224,17 @@ class DashieAndroidVersionSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:android"
     _attr_translation_key = "android_version"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Android Version"
+    _unique_suffix = "android_version"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_android_version"
-        self._attr_name = "Android Version"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the Android version."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("androidVersion")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional device attributes."""
+    def _update_attrs(self) -> None:
+        """Update the Android version and device attributes from coordinator data."""
         if not self.coordinator.data:
-            return {}
-        return {
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        self._attr_native_value = self.coordinator.data.get("androidVersion")
+        self._attr_extra_state_attributes = {
             "device_model": self.coordinator.data.get("deviceModel"),
             "device_manufacturer": self.coordinator.data.get("deviceManufacturer"),
         }
@@ -304,26 +246,17 @@ class DashieAppVersionSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:application-cog"
     _attr_translation_key = "app_version"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "App Version"
+    _unique_suffix = "app_version"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_app_version"
-        self._attr_name = "App Version"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the app version."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("appVersionName")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional version attributes."""
+    def _update_attrs(self) -> None:
+        """Update the app version and attributes from coordinator data."""
         if not self.coordinator.data:
-            return {}
-        return {
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        self._attr_native_value = self.coordinator.data.get("appVersionName")
+        self._attr_extra_state_attributes = {
             "version_code": self.coordinator.data.get("appVersionCode"),
         }
 
@@ -340,22 +273,14 @@ class DashieCameraFrameRateSensor(DashieEntity, SensorEntity):
     _attr_translation_key = "camera_frame_rate"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_native_unit_of_measurement = "fps"
+    _attr_name = "Camera Frame Rate"
+    _unique_suffix = "camera_frame_rate"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_camera_frame_rate"
-        self._attr_name = "Camera Frame Rate"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the camera frame rate."""
-        if self.coordinator.data:
-            # Frame rate comes from rtsp_config (getRtspConfig API), field is "fps"
-            rtsp_config = self.coordinator.data.get("rtsp_config", {})
-            if isinstance(rtsp_config, dict):
-                return rtsp_config.get("fps")
-        return None
+    def _update_attrs(self) -> None:
+        """Update the camera frame rate from coordinator data."""
+        # Flattened from rtsp_config (getRtspConfig API) by the coordinator
+        data = self.coordinator.data
+        self._attr_native_value = data.get("camera_fps") if data else None
 
 
 class DashieCameraResolutionSensor(DashieEntity, SensorEntity):
@@ -364,25 +289,14 @@ class DashieCameraResolutionSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:monitor-screenshot"
     _attr_translation_key = "camera_resolution"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Camera Resolution"
+    _unique_suffix = "camera_resolution"
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_camera_resolution"
-        self._attr_name = "Camera Resolution"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the camera resolution."""
-        if self.coordinator.data:
-            # Resolution comes from rtsp_config (getRtspConfig API)
-            rtsp_config = self.coordinator.data.get("rtsp_config", {})
-            if isinstance(rtsp_config, dict):
-                width = rtsp_config.get("width")
-                height = rtsp_config.get("height")
-                if width and height:
-                    return f"{width}x{height}"
-        return None
+    def _update_attrs(self) -> None:
+        """Update the camera resolution from coordinator data."""
+        # Formatted from rtsp_config (getRtspConfig API) by the coordinator
+        data = self.coordinator.data
+        self._attr_native_value = data.get("camera_resolution") if data else None
 
 
 class DashieCameraStreamUrlSensor(DashieEntity, SensorEntity):
@@ -391,19 +305,11 @@ class DashieCameraStreamUrlSensor(DashieEntity, SensorEntity):
     _attr_icon = "mdi:link"
     _attr_translation_key = "camera_stream_url"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_camera_stream_url"
-        self._attr_name = "Camera Stream URL"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the RTSP stream URL."""
-        if self.coordinator.data:
-            # Stream URL comes from rtsp_status (getRtspStatus API), field is "streamUrl"
-            rtsp_status = self.coordinator.data.get("rtsp_status", {})
-            if isinstance(rtsp_status, dict):
-                return rtsp_status.get("streamUrl")
-        return None
+    _attr_name = "Camera Stream URL"
+    _unique_suffix = "camera_stream_url"
+
+    def _update_attrs(self) -> None:
+        """Update the RTSP stream URL from coordinator data."""
+        # Flattened from rtsp_status (getRtspStatus API) by the coordinator
+        data = self.coordinator.data
+        self._attr_native_value = data.get("camera_stream_url") if data else None
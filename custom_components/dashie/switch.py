@@ -1,10 +1,16 @@
 """Switch entities for Dashie integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
+from homeassistant.components.switch import (
+    SwitchDeviceClass,
+    SwitchEntity,
+    SwitchEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
@@ -32,11 +38,68 @@ from .const import (
     SETTING_RTSP_SOFTWARE_ENCODING,
 )
 from .coordinator import DashieCoordinator
-from .entity import DashieEntity
+from .entity import EMPTY_ATTRS, DashieEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class DashieSettingSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a switch backed by a boolean app setting."""
+
+    data_key: str
+    setting: str
+    entity_category: EntityCategory | None = EntityCategory.CONFIG
+
+
+SETTING_SWITCHES: tuple[DashieSettingSwitchEntityDescription, ...] = (
+    # Display
+    DashieSettingSwitchEntityDescription(
+        key="keep_screen_on",
+        translation_key="keep_screen_on",
+        name="Keep Screen On",
+        icon="mdi:monitor-eye",
+        data_key="keepScreenOn",
+        setting=SETTING_KEEP_SCREEN_ON,
+    ),
+    # Home Assistant
+    DashieSettingSwitchEntityDescription(
+        key="hide_sidebar",
+        translation_key="hide_sidebar",
+        name="Hide Sidebar",
+        icon="mdi:page-layout-sidebar-left",
+        data_key="hideSidebar",
+        setting=SETTING_HIDE_SIDEBAR,
+    ),
+    DashieSettingSwitchEntityDescription(
+        key="hide_tabs",
+        translation_key="hide_tabs",
+        name="Hide Tabs",
+        icon="mdi:tab-remove",
+        data_key="hideHeader",
+        setting=SETTING_HIDE_HEADER,
+    ),
+    # System
+    DashieSettingSwitchEntityDescription(
+        key="start_on_boot",
+        translation_key="start_on_boot",
+        name="Start on Boot",
+        icon="mdi:power",
+        data_key="startOnBoot",
+        setting=SETTING_START_ON_BOOT,
+    ),
+    # Camera
+    DashieSettingSwitchEntityDescription(
+        key="software_encoding",
+        translation_key="software_encoding",
+        name="Camera Software Encoding",
+        icon="mdi:cpu-32-bit",
+        data_key="rtspSoftwareEncoding",
+        setting=SETTING_RTSP_SOFTWARE_ENCODING,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -57,7 +120,6 @@ async def async_setup_entry(
         # =================================================================
         # DISPLAY (CONFIG category with "Display:" prefix)
         # =================================================================
-        DashieKeepScreenOnSwitch(coordinator, device_id),
         DashieAutoBrightnessSwitch(coordinator, device_id),
         DashieDarkModeSwitch(coordinator, device_id),  # Requires WRITE_SECURE_SETTINGS permission
 
@@ -65,253 +127,233 @@ async def async_setup_entry(
         # CAMERA (CONFIG category with "Camera:" prefix)
         # =================================================================
         DashieRtspStreamSwitch(coordinator, device_id),
-        DashieSoftwareEncodingSwitch(coordinator, device_id),
-
-        # =================================================================
-        # CONFIGURATION (CONFIG category with "Config:" prefix)
-        # =================================================================
-        DashieHideSidebarSwitch(coordinator, device_id),
-        DashieHideTabsSwitch(coordinator, device_id),
-
-        # =================================================================
-        # SYSTEM (CONFIG category with "System:" prefix)
-        # =================================================================
-        DashieStartOnBootSwitch(coordinator, device_id),
     ]
 
+    # Boolean app settings: display, Home Assistant, system and camera (CONFIG category)
+    entities.extend(
+        DashieSettingSwitch(coordinator, device_id, description)
+        for description in SETTING_SWITCHES
+    )
+
     async_add_entities(entities)
 
 
-class DashieScreenSwitch(DashieEntity, SwitchEntity):
-    """Screen on/off switch - PRIMARY CONTROL."""
+class DashieSwitch(DashieEntity, SwitchEntity):
+    """Switch whose state mirrors one key of the coordinator data.
+
+    The state is cached in _attr_is_on on each coordinator update, so state
+    reads are attribute lookups.
+    """
 
     _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:monitor"
-    _attr_translation_key = "screen"
-    # No EntityCategory = Primary control (shown prominently)
+    _state_key: str
+    # Send commands even when the cached state already matches. Set for states
+    # the device changes on its own, which may have moved since the last poll.
+    _always_send = False
+    # Poll shortly after a successful command, for commands whose effects
+    # reach other entities and can't be applied optimistically
+    _refresh_after_command = False
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_screen"
-        self._attr_name = "Screen"
+    def _update_attrs(self) -> None:
+        """Update the cached on/off state from coordinator data.
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if screen is on (not in black/off state)."""
-        if self.coordinator.data:
-            # isScreenOn is False only when in true "screen off" black mode
-            return self.coordinator.data.get("isScreenOn", False)
-        return None
+        The reported keys vary by app version; a key the device doesn't report
+        leaves the state unknown, so commands for it are never skipped.
+        """
+        data = self.coordinator.data
+        self._attr_is_on = data.get(self._state_key) if data else None
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the screen on (wake from black/off state)."""
-        await self.coordinator.send_command(API_SCREEN_ON)
-        await self.coordinator.async_request_refresh()
+    async def _async_apply(self, on: bool, command: str, **params: Any) -> None:
+        """Send a command and, if it succeeds, apply the new state locally.
 
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the screen off."""
-        await self.coordinator.send_command(API_SCREEN_OFF)
-        await self.coordinator.async_request_refresh()
+        update_local_data() notifies every listener, so the new state is
+        written right away instead of waiting on a refresh of the device.
+        Nothing is sent if the switch is already in the requested state.
+        """
+        if self._attr_is_on is on and not self._always_send:
+            return
+        if await self.coordinator.send_command(command, **params):
+            self.coordinator.update_local_data(**{self._state_key: on})
+            if self._refresh_after_command:
+                await self.coordinator.async_request_command_refresh()
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes."""
-        if not self.coordinator.data:
-            return {}
-        is_device_admin = self.coordinator.data.get("isDeviceAdmin", False)
-        return {
-            "hardware_screen_off_available": is_device_admin,
-            "screen_off_mode": "hardware" if is_device_admin else "overlay",
-        }
 
 
-class DashieScreensaverSwitch(DashieEntity, SwitchEntity):
-    """Screensaver switch - PRIMARY CONTROL."""
+class DashieCommandSwitch(DashieSwitch):
+    """Switch driven by one device command per state.
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:sleep"
-    _attr_translation_key = "screensaver"
-    # No EntityCategory = Primary control (shown prominently)
+    Subclasses set _commands as (off, on), indexed by the requested state, and
+    _state_key as the coordinator data key reflecting it.
+    """
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_screensaver"
-        self._attr_name = "Screensaver"
+    _commands: tuple[str, str]
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if screensaver is active."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("isInScreensaver", False)
-        return None
+    async def _async_set(self, on: bool) -> None:
+        """Send the command for the requested state and apply it optimistically."""
+        await self._async_apply(on, self._commands[on])
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Start the screensaver."""
-        await self.coordinator.send_command(API_START_SCREENSAVER)
-        await self.coordinator.async_request_refresh()
+        """Turn the switch on."""
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Stop the screensaver."""
-        await self.coordinator.send_command(API_STOP_SCREENSAVER)
-        await self.coordinator.async_request_refresh()
+        """Turn the switch off."""
+        await self._async_set(False)
 
 
-class DashieLockSwitch(DashieEntity, SwitchEntity):
-    """Lock switch (PIN required if set)."""
+class DashieSettingSwitch(DashieSwitch):
+    """Switch for a boolean app setting, defined by its entity description."""
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:lock"
-    _attr_translation_key = "lock"
+    entity_description: DashieSettingSwitchEntityDescription
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
+    def __init__(
+        self,
+        coordinator: DashieCoordinator,
+        device_id: str,
+        description: DashieSettingSwitchEntityDescription,
+    ) -> None:
         """Initialize the switch."""
+        self.entity_description = description
+        self._state_key = description.data_key
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_lock"
-        self._attr_name = "Lock"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if kiosk is locked."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("kioskLocked", False)
-        return None
+        self._attr_unique_id = f"{device_id}_{description.key}"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Lock the kiosk."""
-        await self.coordinator.send_command(API_LOCK_KIOSK)
-        await self.coordinator.async_request_refresh()
+        """Enable the setting."""
+        await self._async_apply(
+            True,
+            API_SET_BOOLEAN_SETTING,
+            key=self.entity_description.setting,
+            value="true",
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Unlock the kiosk (API password is authentication, PIN not required)."""
-        await self.coordinator.send_command(API_UNLOCK_KIOSK)
-        await self.coordinator.async_request_refresh()
-
-
-class DashieDarkModeSwitch(DashieEntity, SwitchEntity):
-    """Dark mode switch."""
-
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:theme-light-dark"
-    _attr_translation_key = "dark_mode"
-    _attr_entity_category = EntityCategory.CONFIG
+        """Disable the setting."""
+        await self._async_apply(
+            False,
+            API_SET_BOOLEAN_SETTING,
+            key=self.entity_description.setting,
+            value="false",
+        )
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_dark_mode"
-        self._attr_name = "Dark Mode"
 
-    @property
-    def available(self) -> bool:
-        """Return True if dark mode is supported on this device."""
-        # First check parent availability (coordinator connected)
-        if not super().available:
-            _LOGGER.info("Dark mode: parent not available")
-            return False
-        if not self.coordinator.data:
-            _LOGGER.info("Dark mode: no coordinator data")
-            return False
-        # Requires WRITE_SECURE_SETTINGS permission (dynamically checked on device)
-        supported = self.coordinator.data.get("supportsDarkMode", True)
-        _LOGGER.info("Dark mode available check: supportsDarkMode=%s, data keys=%s",
-                     supported, list(self.coordinator.data.keys())[:10])
-        return supported
+class DashieScreenSwitch(DashieCommandSwitch):
+    """Screen on/off switch - PRIMARY CONTROL."""
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if dark mode is enabled."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("isDarkMode", False)
-        return None
+    _attr_icon = "mdi:monitor"
+    _attr_translation_key = "screen"
+    # No EntityCategory = Primary control (shown prominently)
+    # isScreenOn is False only when in true "screen off" black mode
+    _commands = (API_SCREEN_OFF, API_SCREEN_ON)
+    _state_key = "isScreenOn"
+    # Screen on also wakes the device, so repeating it is not a no-op
+    _always_send = True
+    # Waking or blanking the screen also changes brightness on the device
+    _refresh_after_command = True
+    _last_is_device_admin: bool | None = None
+    _attr_name = "Screen"
+    _unique_suffix = "screen"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable dark mode."""
-        await self.coordinator.send_command(API_SET_DARK_MODE, value="true")
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable dark mode."""
-        await self.coordinator.send_command(API_SET_DARK_MODE, value="false")
-        await self.coordinator.async_request_refresh()
-
-
-# =============================================================================
-# Home Assistant Section (CONFIG category)
-# =============================================================================
-
-
-class DashieHideSidebarSwitch(DashieEntity, SwitchEntity):
-    """Hide sidebar switch - hides the HA sidebar in the WebView."""
+        """Turn the screen on (wake from black/off state)."""
+        commands = [API_SCREEN_ON]
+        if self.coordinator.data and self.coordinator.data.get("isInScreensaver"):
+            # Dismiss the screensaver in the same round trip
+            commands.insert(0, API_STOP_SCREENSAVER)
+        if await self.coordinator.send_commands(*commands):
+            # Optimistic update instead of a full device poll
+            self.coordinator.update_local_data(isScreenOn=True, isInScreensaver=False)
+            await self.coordinator.async_request_command_refresh()
+
+    def _update_attrs(self) -> None:
+        """Update the cached state and screen-off mode attributes."""
+        super()._update_attrs()
+        if not self.coordinator.data:
+            self._last_is_device_admin = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
+        is_device_admin = self.coordinator.data.get("isDeviceAdmin", False)
+        # Device admin is granted or revoked rarely; keep the dict otherwise
+        if is_device_admin == self._last_is_device_admin:
+            return
+        self._last_is_device_admin = is_device_admin
+        self._attr_extra_state_attributes = {
+            "hardware_screen_off_available": is_device_admin,
+            "screen_off_mode": "hardware" if is_device_admin else "overlay",
+        }
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:page-layout-sidebar-left"
-    _attr_translation_key = "hide_sidebar"
-    _attr_entity_category = EntityCategory.CONFIG
 
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_hide_sidebar"
-        self._attr_name = "Hide Sidebar"
+class DashieScreensaverSwitch(DashieCommandSwitch):
+    """Screensaver switch - PRIMARY CONTROL."""
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if sidebar is hidden."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("hideSidebar", False)
-        return None
+    _attr_icon = "mdi:sleep"
+    _attr_translation_key = "screensaver"
+    # No EntityCategory = Primary control (shown prominently)
+    _commands = (API_STOP_SCREENSAVER, API_START_SCREENSAVER)
+    _state_key = "isInScreensaver"
+    # The screensaver starts on the device's own idle timer
+    _always_send = True
+    # The screensaver also changes the reported screen state
+    _refresh_after_command = True
+    _attr_name = "Screensaver"
+    _unique_suffix = "screensaver"
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Hide the sidebar."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_HIDE_SIDEBAR, value="true"
-        )
-        await self.coordinator.async_request_refresh()
 
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Show the sidebar."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_HIDE_SIDEBAR, value="false"
-        )
-        await self.coordinator.async_request_refresh()
+class DashieLockSwitch(DashieCommandSwitch):
+    """Lock switch (PIN required if set).
 
+    Unlocking doesn't need the PIN: the API password is the authentication.
+    """
 
-class DashieHideTabsSwitch(DashieEntity, SwitchEntity):
-    """Hide tabs switch - hides the HA header/tabs in the WebView."""
+    _attr_icon = "mdi:lock"
+    _attr_translation_key = "lock"
+    _commands = (API_UNLOCK_KIOSK, API_LOCK_KIOSK)
+    _state_key = "kioskLocked"
+    # The kiosk can be unlocked on the tablet itself with the PIN, so the
+    # cached state may be stale by the time a lock command arrives
+    _always_send = True
+    # Entering or leaving kiosk mode changes other device-reported state
+    _refresh_after_command = True
+    _attr_name = "Lock"
+    _unique_suffix = "lock"
+
+
+class DashieDarkModeSwitch(DashieSwitch):
+    """Dark mode switch."""
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:tab-remove"
-    _attr_translation_key = "hide_tabs"
+    _attr_icon = "mdi:theme-light-dark"
+    _attr_translation_key = "dark_mode"
     _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_hide_tabs"
-        self._attr_name = "Hide Tabs"
+    _state_key = "isDarkMode"
+    # Follows Android's dark theme, which also changes on its own schedule or
+    # from quick settings
+    _always_send = True
+    _dark_mode_supported: bool | None = None
+    _attr_name = "Dark Mode"
+    _unique_suffix = "dark_mode"
+
+    def _update_attrs(self) -> None:
+        """Update the cached state and dark mode support flag."""
+        super()._update_attrs()
+        data = self.coordinator.data
+        # Requires WRITE_SECURE_SETTINGS permission (dynamically checked on device)
+        supported = bool(data) and data.get("supportsDarkMode", True)
+        if supported != self._dark_mode_supported:
+            _LOGGER.debug("Dark mode supported: %s", supported)
+            self._dark_mode_supported = supported
 
     @property
-    def is_on(self) -> bool | None:
-        """Return true if tabs/header is hidden."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("hideHeader", False)
-        return None
+    def available(self) -> bool:
+        """Return True if dark mode is supported on this device."""
+        return super().available and self._dark_mode_supported
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Hide the tabs/header."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_HIDE_HEADER, value="true"
-        )
-        await self.coordinator.async_request_refresh()
+        """Enable dark mode."""
+        await self._async_apply(True, API_SET_DARK_MODE, value="true")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Show the tabs/header."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_HIDE_HEADER, value="false"
-        )
-        await self.coordinator.async_request_refresh()
+        """Disable dark mode."""
+        await self._async_apply(False, API_SET_DARK_MODE, value="false")
 
 
 # =============================================================================
@@ -319,55 +361,15 @@ class DashieHideTabsSwitch(DashieEntity, SwitchEntity):
 # =============================================================================
 
 
-class DashieKeepScreenOnSwitch(DashieEntity, SwitchEntity):
-    """Keep screen on switch - prevents screensaver activation."""
-
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:monitor-eye"
-    _attr_translation_key = "keep_screen_on"
-    _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_keep_screen_on"
-        self._attr_name = "Keep Screen On"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if keep screen on is enabled."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("keepScreenOn", False)
-        return None
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable keep screen on."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_KEEP_SCREEN_ON, value="true"
-        )
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable keep screen on."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_KEEP_SCREEN_ON, value="false"
-        )
-        await self.coordinator.async_request_refresh()
-
-
-class DashieAutoBrightnessSwitch(DashieEntity, SwitchEntity):
+class DashieAutoBrightnessSwitch(DashieSwitch):
     """Auto brightness switch - uses ambient light sensor."""
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:brightness-auto"
     _attr_translation_key = "auto_brightness"
     _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_auto_brightness"
-        self._attr_name = "Auto Brightness"
+    _state_key = "autoBrightness"
+    _attr_name = "Auto Brightness"
+    _unique_suffix = "auto_brightness"
 
     @property
     def available(self) -> bool:
@@ -379,170 +381,102 @@ class DashieAutoBrightnessSwitch(DashieEntity, SwitchEntity):
         # Requires WRITE_SETTINGS permission on Android
         return self.coordinator.data.get("canControlBrightness", True)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if auto brightness is enabled."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("autoBrightness", False)
-        return None
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable auto brightness."""
-        success = await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_AUTO_BRIGHTNESS, value="true"
+        await self._async_apply(
+            True, API_SET_BOOLEAN_SETTING, key=SETTING_AUTO_BRIGHTNESS, value="true"
         )
-        if success:
-            # Optimistic update for immediate UI feedback
-            self.coordinator.update_local_data(autoBrightness=True)
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable auto brightness."""
-        success = await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_AUTO_BRIGHTNESS, value="false"
+        await self._async_apply(
+            False, API_SET_BOOLEAN_SETTING, key=SETTING_AUTO_BRIGHTNESS, value="false"
         )
-        if success:
-            # Optimistic update for immediate UI feedback
-            self.coordinator.update_local_data(autoBrightness=False)
-        await self.coordinator.async_request_refresh()
 
 
 # =============================================================================
-# System Settings (CONFIG category)
+# Camera Settings (CONFIG category)
 # =============================================================================
 
 
-class DashieStartOnBootSwitch(DashieEntity, SwitchEntity):
-    """Start on boot switch - auto-launch app when device boots."""
-
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:power"
-    _attr_translation_key = "start_on_boot"
-    _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_start_on_boot"
-        self._attr_name = "Start on Boot"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if start on boot is enabled."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("startOnBoot", False)
-        return None
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable start on boot."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_START_ON_BOOT, value="true"
-        )
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable start on boot."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_START_ON_BOOT, value="false"
-        )
-        await self.coordinator.async_request_refresh()
-
-
-class DashieRtspStreamSwitch(DashieEntity, SwitchEntity):
+class DashieRtspStreamSwitch(DashieSwitch):
     """RTSP camera stream enable/disable switch."""
 
-    _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:video"
     _attr_translation_key = "rtsp_stream"
     _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_rtsp_stream"
-        self._attr_name = "Camera Stream Enabled"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if RTSP streaming is enabled (preference setting)."""
-        if self.coordinator.data:
-            # Read from rtspEnabled preference (not isStreaming which is actual state)
-            return self.coordinator.data.get("rtspEnabled", False)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return RTSP stream attributes."""
+    # rtspEnabled preference, not isStreaming which is the actual server state
+    _state_key = "rtspEnabled"
+    _attr_name = "Camera Stream Enabled"
+    _unique_suffix = "rtsp_stream"
+    _last_rtsp_status: dict[str, Any] | None = None
+
+    # Last requested state, and whether a command sequence is in flight
+    _desired_on = False
+    _applying = False
+
+    def _update_attrs(self) -> None:
+        """Update the cached state and RTSP stream attributes."""
+        super()._update_attrs()
         if not self.coordinator.data:
-            return {}
+            self._last_rtsp_status = None
+            self._attr_extra_state_attributes = EMPTY_ATTRS
+            return
         # Coordinator stores as rtsp_status (underscore), API returns streamUrl
         rtsp_status = self.coordinator.data.get("rtsp_status", {})
-        if isinstance(rtsp_status, dict):
-            return {
-                "stream_url": rtsp_status.get("streamUrl"),
-                "client_count": rtsp_status.get("clientCount", 0),
-            }
-        return {}
+        # Each poll stores a new rtsp_status dict, so an identical object means
+        # only other keys changed (e.g. an optimistic update)
+        if rtsp_status is self._last_rtsp_status:
+            return
+        self._last_rtsp_status = rtsp_status
+        self._attr_extra_state_attributes = {
+            "stream_url": rtsp_status.get("streamUrl"),
+            "client_count": rtsp_status.get("clientCount", 0),
+        }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start RTSP streaming."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_RTSP_ENABLED, value="true"
-        )
-        self.coordinator.update_local_data(rtspEnabled=True)
-        await self.coordinator.send_command(API_START_RTSP_STREAM)
-        await self.coordinator.async_request_refresh()
+        await self._async_request_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop RTSP streaming."""
-        await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_RTSP_ENABLED, value="false"
-        )
-        await self.coordinator.send_command(API_STOP_RTSP_STREAM)
-        self.coordinator.update_local_data(rtspEnabled=False)
-        await self.coordinator.async_request_refresh()
-
-
-class DashieSoftwareEncodingSwitch(DashieEntity, SwitchEntity):
-    """Software encoding switch for RTSP stream."""
-
-    _attr_device_class = SwitchDeviceClass.SWITCH
-    _attr_icon = "mdi:cpu-32-bit"
-    _attr_translation_key = "software_encoding"
-    _attr_entity_category = EntityCategory.CONFIG
-
-    def __init__(self, coordinator: DashieCoordinator, device_id: str) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{device_id}_software_encoding"
-        self._attr_name = "Camera Software Encoding"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if software encoding is enabled."""
-        if self.coordinator.data:
-            # Prefer top-level rtspSoftwareEncoding, fallback to rtsp_config
-            if "rtspSoftwareEncoding" in self.coordinator.data:
-                return self.coordinator.data.get("rtspSoftwareEncoding", False)
-            rtsp_config = self.coordinator.data.get("rtsp_config", {})
-            if isinstance(rtsp_config, dict):
-                return rtsp_config.get("softwareEncoding", False)
-        return None
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable software encoding."""
-        success = await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_RTSP_SOFTWARE_ENCODING, value="true"
-        )
-        if success:
-            self.coordinator.update_local_data(rtspSoftwareEncoding=True)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable software encoding (use hardware encoding)."""
-        success = await self.coordinator.send_command(
-            API_SET_BOOLEAN_SETTING, key=SETTING_RTSP_SOFTWARE_ENCODING, value="false"
-        )
-        if success:
-            self.coordinator.update_local_data(rtspSoftwareEncoding=False)
-        await self.coordinator.async_request_refresh()
+        await self._async_request_state(False)
+
+    async def _async_request_state(self, on: bool) -> None:
+        """Record the requested state and apply it unless already applying.
+
+        Toggles that arrive while a sequence is in flight only update the
+        requested state; the running call re-applies until the device matches
+        the latest request, so rapid toggles collapse without losing the last.
+        """
+        self._desired_on = on
+        if self._applying:
+            return
+        self._applying = True
+        try:
+            applied = None
+            while applied is not self._desired_on:
+                applied = self._desired_on
+                await self._async_apply_desired_state(applied)
+        finally:
+            self._applying = False
+        # Stream URL and client count only come from the device and feed the
+        # camera entity and sensors too, so they can't be applied optimistically
+        await self.coordinator.async_request_command_refresh()
+
+    async def _async_apply_desired_state(self, on: bool) -> None:
+        """Enable and start, or disable and stop, the RTSP stream."""
+        if on:
+            # The server only starts once the setting is enabled, so in order
+            await self._async_apply(
+                True, API_SET_BOOLEAN_SETTING, key=SETTING_RTSP_ENABLED, value="true"
+            )
+            await self.coordinator.send_command(API_START_RTSP_STREAM)
+        else:
+            # Stopping doesn't depend on the setting; send both at once
+            await asyncio.gather(
+                self._async_apply(
+                    False, API_SET_BOOLEAN_SETTING, key=SETTING_RTSP_ENABLED, value="false"
+                ),
+                self.coordinator.send_command(API_STOP_RTSP_STREAM),
+            )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
@@ -23,6 +24,9 @@ from .entity import DashieEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# A settable PIN: exactly four ASCII digits (str.isdigit also accepts e.g. "²")
+_PIN_RE = re.compile(r"[0-9]{4}")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -68,13 +72,11 @@ class DashieDashboardUrlText(DashieEntity, TextEntity):
         self._attr_unique_id = f"{device_id}_dashboard_url"
         self._attr_name = "Dashboard URL"
 
-    @property
-    def native_value(self) -> str:
-        """Return the configured dashboard URL."""
-        if self.coordinator.data:
-            # deviceInfo returns "startUrl", not "dashboardUrl"
-            return self.coordinator.data.get("startUrl", "")
-        return ""
+    def _update_attrs(self) -> None:
+        """Update the configured dashboard URL from coordinator data."""
+        data = self.coordinator.data
+        # deviceInfo returns "startUrl", not "dashboardUrl"
+        self._attr_native_value = data.get("startUrl", "") if data else ""
 
     async def async_set_value(self, value: str) -> None:
         """Set the dashboard URL."""
@@ -82,7 +84,7 @@ class DashieDashboardUrlText(DashieEntity, TextEntity):
             await self.coordinator.send_command(
                 API_SET_STRING_SETTING, key=SETTING_HA_URL, value=value
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_command_refresh()
 
 
 class DashieLoadUrlText(DashieEntity, TextEntity):
@@ -105,18 +107,16 @@ class DashieLoadUrlText(DashieEntity, TextEntity):
         self._attr_unique_id = f"{device_id}_load_url"
         self._attr_name = "Load URL"
 
-    @property
-    def native_value(self) -> str:
-        """Return the current page URL."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("currentPage", "")
-        return ""
+    def _update_attrs(self) -> None:
+        """Update the current page URL from coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get("currentPage", "") if data else ""
 
     async def async_set_value(self, value: str) -> None:
         """Navigate the HA iframe to the given URL."""
         if value:
             await self.coordinator.send_command(API_LOAD_URL, url=value)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_command_refresh()
 
 
 class DashiePinText(DashieEntity, TextEntity):
@@ -137,17 +137,15 @@ class DashiePinText(DashieEntity, TextEntity):
         self._attr_unique_id = f"{device_id}_pin"
         self._attr_name = "Lock PIN"
 
-    @property
-    def native_value(self) -> str:
-        """Return masked PIN status (not actual PIN for security)."""
-        if self.coordinator.data:
-            has_pin = self.coordinator.data.get("hasPinSet", False)
-            return "****" if has_pin else ""
-        return ""
+    def _update_attrs(self) -> None:
+        """Update the masked PIN status (not the actual PIN, for security)."""
+        data = self.coordinator.data
+        self._attr_native_value = "****" if data and data.get("hasPinSet") else ""
 
     async def async_set_value(self, value: str) -> None:
         """Set or clear the PIN."""
-        _LOGGER.debug("PIN set_value called with: '%s' (len=%d)", value, len(value) if value else 0)
+        # Log the length only; the value may be a real PIN
+        _LOGGER.debug("PIN set_value called (len=%d)", len(value))
 
         # Treat "****" (the masked display value) as "clear PIN" request
         if value == "****":
@@ -156,7 +154,7 @@ class DashiePinText(DashieEntity, TextEntity):
             await self.coordinator.send_command(API_CLEAR_PIN)
             # Optimistically update local state for immediate UI feedback
             self.coordinator.update_local_data(hasPinSet=False)
-        elif value and len(value) == 4 and value.isdigit():
+        elif _PIN_RE.fullmatch(value):
             # Set the PIN to a new 4-digit value
             _LOGGER.info("Setting new PIN")
             self.coordinator.set_stored_pin(value)  # Store PIN for unlocking
@@ -170,4 +168,3 @@ class DashiePinText(DashieEntity, TextEntity):
             await self.coordinator.send_command(API_CLEAR_PIN)
             # Optimistically update local state for immediate UI feedback
             self.coordinator.update_local_data(hasPinSet=False)
-        await self.coordinator.async_request_refresh()
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -15,9 +17,11 @@ from homeassistant.components.update import (
     UpdateEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -33,9 +37,17 @@ GITHUB_API_RELEASES = "https://api.github.com/repos/jwlerch78/dashie-ha-integrat
 # Check for updates every 6 hours
 UPDATE_CHECK_INTERVAL = timedelta(hours=6)
 
+# Timeout for the GitHub releases request
+GITHUB_TIMEOUT = aiohttp.ClientTimeout(total=30)
 
+
+@cache
 def _get_current_version_sync() -> str:
-    """Read current version from manifest.json (blocking I/O, run in executor)."""
+    """Read current version from manifest.json (blocking I/O, run in executor).
+
+    The installed version can't change without restarting Home Assistant, so
+    the manifest is only read once per process; reloads reuse the result.
+    """
     try:
         manifest_path = Path(__file__).parent / "manifest.json"
         with open(manifest_path, encoding="utf-8") as f:
@@ -67,11 +79,16 @@ async def async_setup_entry(
     # Read current version in executor to avoid blocking the event loop
     current_version = await hass.async_add_executor_job(_get_current_version_sync)
 
-    # Create a coordinator for checking GitHub releases
-    update_coordinator = DashieUpdateCoordinator(hass)
-
-    # Do initial fetch
-    await update_coordinator.async_config_entry_first_refresh()
+    # One coordinator checks GitHub for the whole integration; reuse it if the
+    # entity is being re-created (e.g. after its entry was reloaded)
+    update_coordinator: DashieUpdateCoordinator | None = hass.data[DOMAIN].get(
+        "_update_coordinator"
+    )
+    if update_coordinator is None:
+        update_coordinator = DashieUpdateCoordinator(hass)
+        # Do initial fetch
+        await update_coordinator.async_config_entry_first_refresh()
+        hass.data[DOMAIN]["_update_coordinator"] = update_coordinator
 
     async_add_entities([DashieUpdateEntity(update_coordinator, entry, current_version)])
 
@@ -88,16 +105,84 @@ class DashieUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=UPDATE_CHECK_INTERVAL,
         )
         self._session = async_get_clientsession(hass)
+        # Validators from the last 200 response; GitHub answers a conditional
+        # request with 304 (no body, not counted against the rate limit)
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._unsub_stop = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+        # Pending early retry after GitHub's rate limit resets
+        self._unsub_rate_limit_retry = None
+
+    async def _async_handle_stop(self, event: Event) -> None:
+        """Stop polling GitHub when Home Assistant shuts down."""
+        # async_listen_once listeners remove themselves once fired
+        self._unsub_stop = None
+        await self.async_shutdown()
+
+    def _schedule_rate_limit_retry(self, reset: str | None) -> None:
+        """Retry once the rate limit resets, if that's before the next poll.
+
+        reset is GitHub's X-RateLimit-Reset header (epoch seconds).
+        """
+        try:
+            delay = float(reset) - time.time()
+        except (TypeError, ValueError):
+            _LOGGER.debug("GitHub API rate limited, will retry later")
+            return
+        # A few seconds of margin so the retry lands after the reset
+        delay = max(delay, 0) + 5
+        if delay >= UPDATE_CHECK_INTERVAL.total_seconds():
+            _LOGGER.debug("GitHub API rate limited, will retry later")
+            return
+        _LOGGER.debug("GitHub API rate limited, retrying in %.0f s", delay)
+        if self._unsub_rate_limit_retry:
+            self._unsub_rate_limit_retry()
+        self._unsub_rate_limit_retry = async_call_later(
+            self.hass, delay, self._async_retry_after_rate_limit
+        )
+
+    async def _async_retry_after_rate_limit(self, _now: datetime) -> None:
+        """Check for a release now that the rate limit has reset."""
+        self._unsub_rate_limit_retry = None
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel polling and stop sharing this coordinator."""
+        if self._unsub_stop:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._unsub_rate_limit_retry:
+            self._unsub_rate_limit_retry()
+            self._unsub_rate_limit_retry = None
+        # A shut-down coordinator no longer refreshes, so setup must not reuse it
+        domain_data = self.hass.data.get(DOMAIN, {})
+        if domain_data.get("_update_coordinator") is self:
+            del domain_data["_update_coordinator"]
+        await super().async_shutdown()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch latest release info from GitHub."""
+        headers = {"Accept": "application/vnd.github.v3+json"}
+        # Only revalidate while there is cached data to fall back on
+        if self.data:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
         try:
             async with self._session.get(
                 GITHUB_API_RELEASES,
-                headers={"Accept": "application/vnd.github.v3+json"},
-                timeout=aiohttp.ClientTimeout(total=30),
+                headers=headers,
+                timeout=GITHUB_TIMEOUT,
             ) as response:
+                if response.status == 304:
+                    # Release unchanged since the last check
+                    return self.data
                 if response.status == 200:
+                    self._etag = response.headers.get("ETag")
+                    self._last_modified = response.headers.get("Last-Modified")
                     data = await response.json()
                     return {
                         "latest_version": data.get("tag_name", "").lstrip("v"),
@@ -107,7 +192,9 @@ class DashieUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     }
                 elif response.status == 403:
                     # Rate limited
-                    _LOGGER.debug("GitHub API rate limited, will retry later")
+                    self._schedule_rate_limit_retry(
+                        response.headers.get("X-RateLimit-Reset")
+                    )
                     return self.data or {}
                 else:
                     _LOGGER.warning(
@@ -148,6 +235,14 @@ class DashieUpdateEntity(CoordinatorEntity[DashieUpdateCoordinator], UpdateEntit
         self._attr_name = "Dashie Integration Update"
         self._current_version = current_version
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Let the next entry set up re-create the entity.
+
+        The shared coordinator stays in hass.data and is reused.
+        """
+        self.hass.data[DOMAIN].pop("_update_entity_created", None)
+        await super().async_will_remove_from_hass()
+
     # Note: No device_info property - this entity is standalone and doesn't
     # create a separate device. This prevents the "Dashie Integration" device
     # from appearing under each Dashie device in the UI.
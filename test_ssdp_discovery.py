@@ -8,23 +8,60 @@ Run this on the same machine as Home Assistant to verify:
 3. The broadcast format is correct
 
 Usage:
-    python3 test_ssdp_discovery.py
+    python3 test_ssdp_discovery.py [EXPECTED_DEVICES]
+
+    With EXPECTED_DEVICES, stops as soon as that many devices are found.
 
 Expected output:
     Should show Dashie NOTIFY packets with device info
 """
 
+import argparse
+import re
+import selectors
 import socket
 import struct
 import time
 import sys
-
-
-def listen_for_dashie_ssdp(duration=30):
-    """Listen for Dashie SSDP NOTIFY broadcasts."""
-    MCAST_GRP = '239.255.255.250'
-    MCAST_PORT = 1900
-
+from dataclasses import dataclass
+from typing import Optional
+
+MCAST_GRP = '239.255.255.250'
+MCAST_PORT = 1900
+# ip_mreq for joining the SSDP group on the default interface
+MCAST_MREQ = struct.pack(
+    '=4sI', socket.inet_pton(socket.AF_INET, MCAST_GRP), socket.INADDR_ANY
+)
+
+# SSDP headers reported for each device, one named group per DashieDevice field
+# (matched on the raw packet bytes; only the captured values are decoded)
+SSDP_HEADER_RE = re.compile(
+    rb'^[ \t]*(?:'
+    rb'(?:NT|ST):(?P<st>.*)'
+    rb'|X-DASHIE-NAME:(?P<name>.*)'
+    rb'|X-DASHIE-API:(?P<api>.*)'
+    rb'|USN:(?P<usn>.*)'
+    rb')$',
+    re.MULTILINE,
+)
+
+
+@dataclass
+class DashieDevice:
+    """A Dashie device seen on the network, from its SSDP headers."""
+
+    ip: str
+    st: Optional[str] = None
+    name: Optional[str] = None
+    api: Optional[str] = None
+    usn: Optional[str] = None
+
+
+def listen_for_dashie_ssdp(duration=30, expected=None):
+    """Listen for Dashie SSDP NOTIFY broadcasts.
+
+    Stops early once `expected` devices have been found, if given.
+    """
     print(f"🔍 Listening for Dashie SSDP packets for {duration} seconds...")
     print(f"   Multicast address: {MCAST_GRP}:{MCAST_PORT}")
     print(f"   Looking for ST: urn:dashie:service:DashieLite:1 or urn:dashie:service:Dashie:1")
@@ -33,6 +70,15 @@ def listen_for_dashie_ssdp(duration=30):
     # Create UDP socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Share the port with other SSDP listeners where supported
+    if hasattr(socket, 'SO_REUSEPORT'):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    # Room for bursts of NOTIFYs from many devices (the kernel may cap this)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    if sys.platform.startswith('linux'):
+        # Only deliver multicast for groups this socket joined, not every
+        # group joined on the host (IP_MULTICAST_ALL, not exposed by Python)
+        sock.setsockopt(socket.IPPROTO_IP, getattr(socket, 'IP_MULTICAST_ALL', 49), 0)
 
     try:
         sock.bind(('', MCAST_PORT))
@@ -45,71 +91,74 @@ def listen_for_dashie_ssdp(duration=30):
 
     # Join multicast group
     try:
-        mreq = struct.pack('4sL', socket.inet_aton(MCAST_GRP), socket.INADDR_ANY)
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, MCAST_MREQ)
     except OSError as e:
         print(f"❌ ERROR: Cannot join multicast group")
         print(f"   {e}")
         return False
 
-    sock.settimeout(1.0)
+    # Wait for packets with a selector rather than a socket timeout, so the
+    # loop only wakes for data or when the next progress dot is due
+    sel = selectors.DefaultSelector()
+    sel.register(sock, selectors.EVENT_READ)
 
-    start = time.time()
+    start = time.monotonic()
+    deadline = start + duration
+    next_dot = start + 5
     dashie_devices_found = {}
     packet_count = 0
+    # Bound once; these run on every loop iteration
+    monotonic = time.monotonic
+    select = sel.select
+    recvfrom = sock.recvfrom
 
     try:
-        while time.time() - start < duration:
-            try:
-                data, addr = sock.recvfrom(4096)
-                packet_count += 1
-                message = data.decode('utf-8', errors='ignore')
-
-                # Check if it's a Dashie device
-                if 'dashie' in message.lower():
-                    # Parse device info
-                    lines = message.split('\n')
-                    device_info = {
-                        'ip': addr[0],
-                        'st': None,
-                        'name': None,
-                        'api': None,
-                        'usn': None
-                    }
-
-                    for line in lines:
-                        line = line.strip()
-                        if line.startswith('NT:') or line.startswith('ST:'):
-                            device_info['st'] = line.split(':', 1)[1].strip()
-                        elif line.startswith('X-DASHIE-NAME:'):
-                            device_info['name'] = line.split(':', 1)[1].strip()
-                        elif line.startswith('X-DASHIE-API:'):
-                            device_info['api'] = line.split(':', 1)[1].strip()
-                        elif line.startswith('USN:'):
-                            device_info['usn'] = line.split(':', 1)[1].strip()
-
-                    # Store device (keyed by IP to dedupe)
-                    if device_info['ip'] not in dashie_devices_found:
-                        dashie_devices_found[device_info['ip']] = device_info
-                        print(f"✅ Found Dashie device #{len(dashie_devices_found)}:")
-                        print(f"   Name: {device_info['name']}")
-                        print(f"   IP: {device_info['ip']}")
-                        print(f"   API: {device_info['api']}")
-                        print(f"   Service Type: {device_info['st']}")
-                        print(f"   USN: {device_info['usn']}")
-                        print()
-
-            except socket.timeout:
-                # Print progress dot every second
-                elapsed = int(time.time() - start)
-                if elapsed % 5 == 0:
-                    sys.stdout.write('.')
-                    sys.stdout.flush()
+        while True:
+            now = monotonic()
+            if now >= deadline:
+                break
+            # Print progress dot every 5 seconds
+            if now >= next_dot:
+                sys.stdout.write('.')
+                sys.stdout.flush()
+                next_dot += 5
+            if not select(timeout=min(next_dot, deadline) - now):
                 continue
 
+            data, addr = recvfrom(4096)
+            packet_count += 1
+
+            # Check if it's a Dashie device (on the raw bytes; packets are
+            # never decoded as a whole). Devices re-announce every
+            # few seconds; only the first packet per IP is parsed.
+            if b'dashie' in data.lower() and addr[0] not in dashie_devices_found:
+                # Parse device info
+                device = DashieDevice(ip=addr[0])
+                for match in SSDP_HEADER_RE.finditer(data):
+                    field = match.lastgroup
+                    value = match.group(field).decode('utf-8', errors='ignore')
+                    setattr(device, field, value.strip())
+
+                # Store device (keyed by IP to dedupe)
+                dashie_devices_found[device.ip] = device
+                # One write (and flush) per device rather than one per line
+                sys.stdout.write(
+                    f"✅ Found Dashie device #{len(dashie_devices_found)}:\n"
+                    f"   Name: {device.name}\n"
+                    f"   IP: {device.ip}\n"
+                    f"   API: {device.api}\n"
+                    f"   Service Type: {device.st}\n"
+                    f"   USN: {device.usn}\n"
+                    "\n"
+                )
+                sys.stdout.flush()
+                if expected is not None and len(dashie_devices_found) >= expected:
+                    break
+
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
     finally:
+        sel.close()
         sock.close()
 
     print(f"\n")
@@ -140,12 +189,30 @@ def listen_for_dashie_ssdp(duration=30):
         return True
 
 
+def positive_int(value):
+    """argparse type for a device count of at least 1."""
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return count
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Listen for Dashie SSDP broadcasts.")
+    parser.add_argument(
+        'expected', nargs='?', type=positive_int, metavar='EXPECTED_DEVICES',
+        help="stop as soon as this many devices are found",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Dashie SSDP Discovery Test")
     print("=" * 60)
     print()
 
-    success = listen_for_dashie_ssdp(duration=30)
+    success = listen_for_dashie_ssdp(duration=30, expected=args.expected)
 
     sys.exit(0 if success else 1)
@@ -0,0 +1,90 @@
+"""DashieCoordinator tests for the Dashie integration.
+
+Entity commands apply their result optimistically with update_local_data(),
+which goes through async_set_updated_data() and cancels the coordinator's
+request_refresh debouncer. The poll confirming a command must survive that.
+Also covers _normalize_data, which fixes the shape of each poll's data so
+entities can read it without re-checking types.
+"""
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.dashie.coordinator import (
+    COMMAND_REFRESH_DELAY,
+    DashieCoordinator,
+)
+
+IPV4 = "192.168.23.96"
+
+
+async def test_command_refresh_survives_optimistic_update(hass: HomeAssistant) -> None:
+    """A burst of commands with optimistic updates still gets one confirming poll."""
+    coordinator = DashieCoordinator(hass, IPV4, 2323)
+    coordinator.data = {"isScreenOn": False, "keepScreenOn": False}
+
+    with patch.object(
+        coordinator,
+        "_async_update_data",
+        AsyncMock(return_value={"isScreenOn": True, "keepScreenOn": True}),
+    ) as update:
+        # e.g. a scene turning the screen on, then Keep Screen On
+        await coordinator.async_request_command_refresh()
+        coordinator.update_local_data(isScreenOn=True)
+        await coordinator.async_request_command_refresh()
+        coordinator.update_local_data(keepScreenOn=True)
+        assert update.await_count == 0  # deferred, not run inline
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=COMMAND_REFRESH_DELAY + 1)
+        )
+        await hass.async_block_till_done()
+
+    assert update.await_count == 1
+    await coordinator.async_shutdown()
+
+
+def test_normalize_drops_malformed_rtsp_payloads() -> None:
+    """Non-dict RTSP payloads are removed and the camera keys fall back to None."""
+    data = DashieCoordinator._normalize_data(
+        {"rtsp_status": "ERROR", "rtsp_config": ["unexpected"]}
+    )
+
+    assert "rtsp_status" not in data
+    assert "rtsp_config" not in data
+    assert data["camera_fps"] is None
+    assert data["camera_resolution"] is None
+    assert data["camera_stream_url"] is None
+    assert data["rtspSoftwareEncoding"] is False
+
+
+def test_normalize_flattens_camera_keys() -> None:
+    """Camera keys come from the RTSP payloads; resolution needs both dimensions."""
+    data = DashieCoordinator._normalize_data(
+        {
+            "rtsp_config": {"fps": 15, "width": 1280, "softwareEncoding": True},
+            "rtsp_status": {"streamUrl": f"rtsp://{IPV4}:8554/stream"},
+        }
+    )
+
+    assert data["camera_fps"] == 15
+    assert data["camera_resolution"] is None  # no height reported
+    assert data["camera_stream_url"] == f"rtsp://{IPV4}:8554/stream"
+    # Older app versions: encoder only reported inside rtsp_config
+    assert data["rtspSoftwareEncoding"] is True
+
+    data["rtsp_config"]["height"] = 720
+    assert DashieCoordinator._normalize_data(data)["camera_resolution"] == "1280x720"
+
+
+def test_normalize_keeps_reported_software_encoding() -> None:
+    """A top-level rtspSoftwareEncoding from the device wins over rtsp_config."""
+    data = DashieCoordinator._normalize_data(
+        {"rtspSoftwareEncoding": False, "rtsp_config": {"softwareEncoding": True}}
+    )
+
+    assert data["rtspSoftwareEncoding"] is False
@@ -0,0 +1,104 @@
+"""Switch platform tests for the Dashie integration.
+
+Guards the platform's entity set: the boolean settings are generated from
+SETTING_SWITCHES descriptions next to the hand-written switch classes, so a
+duplicated or dropped description would silently change which entities exist.
+Also covers the RTSP stream switch keeping the latest toggle when it arrives
+while an earlier command sequence is still in flight, and switches whose key
+the device doesn't report still sending their commands.
+"""
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dashie.const import API_SET_BOOLEAN_SETTING, API_STOP_RTSP_STREAM
+from custom_components.dashie.coordinator import DashieCoordinator
+from custom_components.dashie.switch import (
+    SETTING_SWITCHES,
+    DashieRtspStreamSwitch,
+    DashieSettingSwitch,
+    async_setup_entry,
+)
+
+DOMAIN = "dashie"
+DEVICE_ID = "a83e167a70e648255f71a1744d25f740"
+IPV4 = "192.168.23.96"
+
+
+async def test_setup_creates_each_switch_once(hass: HomeAssistant) -> None:
+    """Every switch is created exactly once, with a distinct unique ID."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=DEVICE_ID,
+        data={"host": IPV4, "port": 2323, "device_id": DEVICE_ID},
+    )
+    entry.add_to_hass(hass)
+    coordinator = DashieCoordinator(hass, IPV4, 2323, config_entry=entry)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    entities = []
+    await async_setup_entry(hass, entry, entities.extend)
+
+    assert len([e for e in entities if isinstance(e, SwitchEntity)]) == 11
+    unique_ids = {e.unique_id for e in entities}
+    assert len(unique_ids) == len(entities)
+    assert f"{DEVICE_ID}_screen" in unique_ids
+    assert f"{DEVICE_ID}_software_encoding" in unique_ids
+
+
+async def test_rtsp_toggle_during_command_is_applied(hass: HomeAssistant) -> None:
+    """Turning the stream off while the turn-on commands run must not be lost."""
+    coordinator = DashieCoordinator(hass, IPV4, 2323)
+    coordinator.data = {"rtspEnabled": False}
+    switch = DashieRtspStreamSwitch(coordinator, DEVICE_ID)
+    switch.hass = hass
+    # Stand-in for the entity's coordinator listener (the entity isn't added)
+    coordinator.async_add_listener(switch._update_attrs)
+
+    release = asyncio.Event()
+    sent = []
+
+    async def send_command(command, **params):
+        sent.append((command, params.get("value")))
+        if len(sent) == 1:
+            await release.wait()  # hold the first turn-on command in flight
+        return True
+
+    with patch.object(coordinator, "send_command", side_effect=send_command):
+        turn_on = hass.async_create_task(switch.async_turn_on())
+        await asyncio.sleep(0)
+        assert sent == [(API_SET_BOOLEAN_SETTING, "true")]
+
+        await switch.async_turn_off()  # returns at once; the on call applies it
+        release.set()
+        await turn_on
+
+    # Turn-off sends its two commands concurrently, in either order
+    assert sorted(sent[-2:]) == sorted(
+        [(API_SET_BOOLEAN_SETTING, "false"), (API_STOP_RTSP_STREAM, None)]
+    )
+    assert coordinator.data["rtspEnabled"] is False
+    assert switch.is_on is False
+    await coordinator.async_shutdown()
+
+
+async def test_unreported_state_does_not_skip_commands(hass: HomeAssistant) -> None:
+    """A key missing from the payload is unknown, not off, so turn-off is sent."""
+    coordinator = DashieCoordinator(hass, IPV4, 2323)
+    # Older app versions don't report startOnBoot
+    coordinator.data = {"isScreenOn": True}
+    description = next(d for d in SETTING_SWITCHES if d.data_key == "startOnBoot")
+    switch = DashieSettingSwitch(coordinator, DEVICE_ID, description)
+
+    assert switch.is_on is None
+    with patch.object(coordinator, "send_command", return_value=True) as send:
+        await switch.async_turn_off()
+
+    send.assert_awaited_once_with(
+        API_SET_BOOLEAN_SETTING, key=description.setting, value="false"
+    )
+    await coordinator.async_shutdown()
@@ -0,0 +1,104 @@
+"""Update coordinator tests for the Dashie integration.
+
+The release check polls GitHub's unauthenticated API, which allows 60 requests
+an hour per IP. These cover the conditional request that keeps polls off that
+budget (304 → cached release info) and the handling of a 403 rate limit: an
+early retry when X-RateLimit-Reset falls before the next regular poll.
+"""
+import time
+from unittest.mock import Mock, patch
+
+from aioresponses import aioresponses
+from homeassistant.core import HomeAssistant
+
+from custom_components.dashie.update import (
+    GITHUB_API_RELEASES,
+    UPDATE_CHECK_INTERVAL,
+    DashieUpdateCoordinator,
+)
+
+RELEASE = {
+    "latest_version": "1.2.3",
+    "release_url": "https://github.com/jwlerch78/dashie-ha-integration/releases/tag/v1.2.3",
+    "release_notes": "Fixes",
+    "published_at": "2026-06-01T00:00:00Z",
+}
+
+
+async def test_not_modified_keeps_cached_release(hass: HomeAssistant) -> None:
+    """A 304 to the conditional request keeps the cached release info."""
+    coordinator = DashieUpdateCoordinator(hass)
+    coordinator.data = RELEASE
+    coordinator._etag = '"abc123"'
+
+    with aioresponses() as mock:
+        mock.get(GITHUB_API_RELEASES, status=304)
+        await coordinator.async_refresh()
+        (request,) = next(iter(mock.requests.values()))
+
+    assert request.kwargs["headers"]["If-None-Match"] == '"abc123"'
+    assert coordinator.last_update_success
+    assert coordinator.data == RELEASE
+    await coordinator.async_shutdown()
+
+
+async def test_rate_limit_schedules_retry_at_reset(hass: HomeAssistant) -> None:
+    """A 403 with a near reset retries just after it; shutdown cancels the retry."""
+    coordinator = DashieUpdateCoordinator(hass)
+    coordinator.data = RELEASE
+    unsub = Mock()
+    reset = time.time() + 600
+
+    with aioresponses() as mock, patch(
+        "custom_components.dashie.update.async_call_later", return_value=unsub
+    ) as call_later:
+        mock.get(
+            GITHUB_API_RELEASES,
+            status=403,
+            headers={"X-RateLimit-Reset": str(int(reset))},
+        )
+        await coordinator.async_refresh()
+
+    call_later.assert_called_once()
+    delay = call_later.call_args.args[1]
+    assert 600 <= delay <= 606  # reset, plus a few seconds of margin
+    assert coordinator.data == RELEASE
+
+    await coordinator.async_shutdown()
+    unsub.assert_called_once()
+
+
+async def test_rate_limit_reset_after_next_poll_is_not_retried(hass: HomeAssistant) -> None:
+    """A reset later than the regular poll interval leaves it to the next poll."""
+    coordinator = DashieUpdateCoordinator(hass)
+    reset = time.time() + UPDATE_CHECK_INTERVAL.total_seconds() + 3600
+
+    with aioresponses() as mock, patch(
+        "custom_components.dashie.update.async_call_later"
+    ) as call_later:
+        mock.get(
+            GITHUB_API_RELEASES,
+            status=403,
+            headers={"X-RateLimit-Reset": str(int(reset))},
+        )
+        await coordinator.async_refresh()
+
+    call_later.assert_not_called()
+    await coordinator.async_shutdown()
+
+
+async def test_rate_limit_without_reset_header(hass: HomeAssistant) -> None:
+    """A 403 without X-RateLimit-Reset keeps cached data and waits for the next poll."""
+    coordinator = DashieUpdateCoordinator(hass)
+    coordinator.data = RELEASE
+
+    with aioresponses() as mock, patch(
+        "custom_components.dashie.update.async_call_later"
+    ) as call_later:
+        mock.get(GITHUB_API_RELEASES, status=403)
+        await coordinator.async_refresh()
+
+    call_later.assert_not_called()
+    assert coordinator.last_update_success
+    assert coordinator.data == RELEASE
+    await coordinator.async_shutdown()